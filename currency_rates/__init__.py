@@ -1,9 +1,11 @@
 """Currency rates package — public API re-exported here."""
 from __future__ import annotations
 
-from .config import CURRENCIES, TARGET, TIMEOUT, HEADERS, ROOT
+from .config import CURRENCIES, CURRENCY_CODES, TARGET, TIMEOUT, HEADERS, ROOT
 from .models import Rate
 from .browser_pool import BrowserPool
+from .http_client import create_session
+from .rate_cache import RateCache
 from .runner import fetch_all, _fetch_one
 from .readme_builder import build_readme
 from .providers.base import Provider
@@ -12,12 +14,15 @@ from .providers import PROVIDERS
 __all__ = [
     "fetch_all",
     "CURRENCIES",
+    "CURRENCY_CODES",
     "TARGET",
     "TIMEOUT",
     "HEADERS",
     "ROOT",
     "Rate",
     "BrowserPool",
+    "create_session",
+    "RateCache",
     "build_readme",
     "Provider",
     "PROVIDERS",
@@ -2,19 +2,31 @@
 from __future__ import annotations
 
 import asyncio
+import logging
+import re
 from contextlib import asynccontextmanager
+from pathlib import Path
 
-from currency_rates.config import HEADERS
+from currency_rates.config import BROWSER_STATE_PATH, HEADERS
+
+logger = logging.getLogger(__name__)
 
 
 class BrowserPool:
-    """Single Chromium instance; serialised page usage for WU, WorldRemit, Xoom."""
+    """Single Chromium instance; serialised page usage for WU, WorldRemit, Xoom.
+
+    The context's cookies and localStorage are saved to *state_path* on :meth:`stop`
+    and restored on the next start; pass ``None`` for a fresh context every time.
+    """
 
-    def __init__(self, max_pages: int = 12):
+    def __init__(self, max_pages: int = 12, state_path: Path | None = BROWSER_STATE_PATH):
+        self._max_pages = max_pages
+        self._state_path = state_path
         self._sem = asyncio.Semaphore(max_pages)
         self._pw = None
         self._browser = None
         self._context = None
+        self._idle: list = []
         self._started = False
         self._init_lock = asyncio.Lock()
 
@@ -30,42 +42,70 @@ class BrowserPool:
                 headless=True,
                 args=["--disable-blink-features=AutomationControlled"],
             )
+            state = self._state_path
             self._context = await self._browser.new_context(
                 viewport={"width": 1440, "height": 900},
                 user_agent=HEADERS["User-Agent"],
                 locale="en-US",
+                storage_state=state if state and state.is_file() else None,
             )
             await self._context.add_init_script(
                 "Object.defineProperty(navigator, 'webdriver', { get: () => undefined });"
             )
+            # Routes live on the context so every page inherits them without a
+            # per-page round-trip. Both patterns are matched by the driver, so
+            # Python only hears about requests it is about to abort.
+            await self._context.route(self._BLOCKED_ASSETS, lambda route: route.abort())
+            await self._context.route(self._BLOCKED_RE, lambda route: route.abort())
             self._started = True
 
-    _BLOCKED = {"image", "media", "font", "stylesheet"}
-    _BLOCKED_DOMAINS = {
+    # Images, media, fonts and stylesheets, by extension (query string allowed), plus
+    # Next.js's extensionless image optimiser. Other extensionless assets are caught
+    # only when their host is in _BLOCKED_DOMAINS (e.g. the web-font CDNs).
+    _BLOCKED_ASSETS = re.compile(
+        r"\.(?:png|jpe?g|gif|webp|avif|svg|ico|mp4|webm|woff2?|ttf|otf|css)(?:[?#]|$)"
+        r"|/_next/image\?",
+        re.I,
+    )
+    _BLOCKED_DOMAINS = frozenset({
+        "fonts.googleapis.com", "fonts.gstatic.com", "use.typekit.net",
         "google-analytics.com", "googletagmanager.com", "facebook.net",
         "doubleclick.net", "hotjar.com", "segment.io", "segment.com",
         "newrelic.com", "nr-data.net", "sentry.io", "datadoghq.com",
         "optimizely.com", "amplitude.com", "mixpanel.com", "braze.com",
         "appsflyer.com", "branch.io", "mparticle.com",
-    }
+    })
+    # One union pattern so Playwright matches tracker and font-CDN URLs without a Python callback.
+    _BLOCKED_RE = re.compile("|".join(re.escape(d) for d in sorted(_BLOCKED_DOMAINS)))
+
+    async def prewarm(self, n: int) -> None:
+        """Start the browser and open up to *n* blank pages ahead of the first :meth:`page`."""
+        await self._start()
+        n = min(n, self._max_pages) - len(self._idle)
+        if n > 0:
+            self._idle.extend(await asyncio.gather(*(self._context.new_page() for _ in range(n))))
 
     @asynccontextmanager
     async def page(self):
+        """Lend a page; pages are recycled across calls instead of closed."""
         await self._start()
         async with self._sem:
-            p = await self._context.new_page()
-            def _block(route):
-                req = route.request
-                if req.resource_type in self._BLOCKED:
-                    return True
-                return any(d in req.url for d in self._BLOCKED_DOMAINS)
-            await p.route("**/*", lambda route: route.abort() if _block(route) else route.continue_())
+            p = self._idle.pop() if self._idle else await self._context.new_page()
             try:
                 yield p
             finally:
-                await p.close()
+                if not p.is_closed():
+                    self._idle.append(p)
 
     async def stop(self) -> None:
+        self._idle.clear()
+        if self._context and self._state_path:
+            try:
+                self._state_path.parent.mkdir(parents=True, exist_ok=True)
+                await self._context.storage_state(path=self._state_path)
+            except Exception as e:
+                logger.warning("  [browser] could not save storage state: %s", e)
+        self._context = None
         if self._browser:
             await self._browser.close()
             self._browser = None
@@ -6,7 +6,16 @@ from pathlib import Path
 import aiohttp
 
 ROOT = Path(__file__).resolve().parent.parent
+RATE_CACHE_PATH = ROOT / ".rate_cache.json"
+# Raw API responses reused across runs for their TTL (see http_client.cached_json).
+RESPONSE_CACHE_DIR = ROOT / ".cache"
+# Persistent Chromium profiles for the Scrapling sessions (cookies, HTTP cache), one per worker.
+BROWSER_PROFILE_DIR = ROOT / ".browser_cache"
+# Cookies and localStorage of the Playwright context, so bot checks passed last run stay passed.
+BROWSER_STATE_PATH = BROWSER_PROFILE_DIR / "playwright-state.json"
 TARGET = "BDT"
+# How timestamps are shown in README.md.
+DISPLAY_TIME_FORMAT = "%Y-%m-%d %H:%M UTC"
 TIMEOUT = aiohttp.ClientTimeout(total=10)
 
 CURRENCIES = [
@@ -23,10 +32,13 @@ CURRENCIES = [
     ("QAR", "﷼", "🇶🇦", "Qatari Riyal"),
     ("JPY", "¥", "🇯🇵", "Japanese Yen"),
 ]
+# Just the codes, in CURRENCIES order, for loops that need nothing else.
+CURRENCY_CODES: tuple[str, ...] = tuple(code for code, *_ in CURRENCIES)
 
 HEADERS = {
     "User-Agent": (
         "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
         "AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36"
     ),
+    "Accept-Language": "en-US,en;q=0.9",
 }
@@ -0,0 +1,26 @@
+"""Cheap HTML-to-text conversion for regex-based rate extraction."""
+from __future__ import annotations
+
+import html as _html
+import re
+
+# Comments and script/style/template bodies never carry visible rates; drop them whole.
+_SKIP_RE = re.compile(
+    r"<!--.*?-->|<(script|style|template)\b[^>]*>.*?</\1\s*>", re.S | re.I
+)
+_TAG_RE = re.compile(r"<[^>]+>")
+_WS_RE = re.compile(r"\s+")
+
+# "123.456 BDT" anywhere in page text — the generic fallback most HTML providers share.
+# ASCII-only \d/\s: html_to_text has already folded Unicode whitespace into spaces.
+BDT_NUMBER_RE = re.compile(r"(\d{2,4}\.\d{1,6})\s*BDT", re.ASCII)
+
+
+def html_to_text(html: str) -> str:
+    """Return the visible text of *html*, tags replaced by single spaces.
+
+    Equivalent for our regexes to ``BeautifulSoup(html, "html.parser").get_text(" ", strip=True)``
+    but runs as three C-level regex passes instead of building a parse tree.
+    """
+    text = _TAG_RE.sub(" ", _SKIP_RE.sub(" ", html))
+    return _WS_RE.sub(" ", _html.unescape(text)).strip()
@@ -0,0 +1,61 @@
+"""aiohttp session factory and cached JSON GET, shared by the runner and providers."""
+from __future__ import annotations
+
+import hashlib
+import ssl
+import time
+from pathlib import Path
+from typing import Any
+
+import aiohttp
+import certifi
+import orjson
+
+from currency_rates.config import HEADERS, RESPONSE_CACHE_DIR, TIMEOUT
+
+# Parsing the certifi CA bundle is the expensive part of TLS setup; do it once per process.
+_SSL_CTX = ssl.create_default_context(cafile=certifi.where())
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Return a pooled session for scraping; the caller owns and closes it.
+
+    Keep-alive connections and cached DNS are reused across the per-currency
+    requests to the same host; idle connections are kept for 30s so a provider's
+    later currencies (behind the runner's per-provider limiter) still find one warm.
+    Must be called with an event loop running.
+    """
+    conn = aiohttp.TCPConnector(
+        ssl=_SSL_CTX, limit=100, limit_per_host=10, ttl_dns_cache=300,
+        keepalive_timeout=30,
+    )
+    return aiohttp.ClientSession(headers=HEADERS, connector=conn, timeout=TIMEOUT)
+
+
+async def cached_json(
+    session: aiohttp.ClientSession, url: str, ttl: float,
+    headers: dict[str, str] | None = None, cache_dir: Path = RESPONSE_CACHE_DIR,
+) -> Any | None:
+    """GET *url* and decode its JSON body, or ``None`` on a non-200 response.
+
+    The raw body is kept under *cache_dir*, keyed by URL and headers,
+    and served without a request while younger than *ttl* seconds.
+    """
+    key = hashlib.sha1(orjson.dumps([url, headers], option=orjson.OPT_SORT_KEYS)).hexdigest()
+    path = cache_dir / f"{key}.json"
+    try:
+        if time.time() - path.stat().st_mtime < ttl:
+            return orjson.loads(path.read_bytes())
+    except (OSError, orjson.JSONDecodeError):
+        pass
+    async with session.get(url, headers=headers, timeout=TIMEOUT) as r:
+        if r.status != 200:
+            return None
+        body = await r.read()
+    data = orjson.loads(body)
+    try:
+        path.parent.mkdir(exist_ok=True)
+        path.write_bytes(body)
+    except OSError:
+        pass
+    return data
@@ -4,10 +4,17 @@ from __future__ import annotations
 from dataclasses import dataclass
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Rate:
     provider: str
     url: str
     rate: float
     delivery: str
     fee: float | None = None
+
+    def to_dict(self) -> dict:
+        """Plain dict for rates.json; a literal instead of ``dataclasses.asdict``'s deep copy."""
+        return {
+            "provider": self.provider, "url": self.url, "rate": self.rate,
+            "delivery": self.delivery, "fee": self.fee,
+        }
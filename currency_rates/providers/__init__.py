@@ -22,9 +22,11 @@ from .scrapling_providers import (
     Nsave,
 )
 
-PROVIDERS: list = [
+from .base import Provider
+
+PROVIDERS: tuple[Provider, ...] = (
     Wise(), Remitly(), TapTapSend(), Nala(), Instarem(), Xe(),
     OrbitRemit(), SendWave(), Paysend(),
     WesternUnion(), WorldRemit(), Xoom(),
     Ria(), MoneyGram(), Nsave(),
-]
+)
@@ -1,13 +1,15 @@
 from __future__ import annotations
 
+import asyncio
 import logging
+import time
 from abc import ABC, abstractmethod
-from dataclasses import asdict
 from typing import ClassVar
 
 import aiohttp
 
 from currency_rates.models import Rate
+from currency_rates.rate_cache import MAX_STALE_AGE, RateCache
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +22,10 @@ class Provider(ABC):
     error handling, ``Rate`` construction — is automatic.
 
     Override :meth:`get_url` if the provider URL varies per currency.
+    Set ``returns_fee`` when :meth:`fetch_rate` returns ``(rate, fee)`` tuples,
+    and ``cache_ttl`` (seconds) to serve results from the on-disk rate cache.
+    ``timeout`` caps one :meth:`fetch_rate` call, and ``concurrency`` caps how
+    many of the provider's calls the runner lets run at once.
     """
 
     name: ClassVar[str]
@@ -27,33 +33,101 @@ class Provider(ABC):
     delivery: ClassVar[str]
     uses_browser: ClassVar[bool] = False
     uses_scrapling: ClassVar[bool] = False
+    returns_fee: ClassVar[bool] = False
+    cache_ttl: ClassVar[float] = 0
+    timeout: ClassVar[float] = 12.0
+    concurrency: ClassVar[int] = 5
+
+    _rate_cache: RateCache | None = None
+    _url_table: ClassVar[dict[str, str]] = {}
+
+    def __init__(self):
+        self._inflight: dict[str, asyncio.Task[Rate | None]] = {}
+
+    def __init_subclass__(cls, **kwargs):
+        super().__init_subclass__(**kwargs)
+        cls._url_table = {}
 
     @abstractmethod
     async def fetch_rate(
         self, session: aiohttp.ClientSession, src: str
     ) -> float | tuple[float, float | None] | None:
-        """Return the BDT rate (or (rate, fee)) for *src* currency, or ``None``."""
+        """Return the BDT rate for *src* currency, or ``None``.
+
+        Providers with ``returns_fee`` return ``(rate, fee)`` instead; fee may be ``None``.
+        """
 
     def get_url(self, src: str) -> str:
         """Return the user-facing URL for a given source currency."""
         return self.url
 
+    def _url_for(self, src: str) -> str:
+        """:meth:`get_url`, resolved once per (class, currency) and then looked up."""
+        url = self._url_table.get(src)
+        if url is None:
+            url = self._url_table[src] = self.get_url(src)
+        return url
+
     async def scrape(
         self, session: aiohttp.ClientSession, src: str
     ) -> Rate | None:
-        """Fetch, wrap in a ``Rate``, and handle errors. Do not override."""
+        """Fetch, wrap in a ``Rate``, and handle errors. Do not override.
+
+        With a rate cache wired in, an entry younger than ``cache_ttl`` skips the
+        fetch, and a failed fetch falls back to the last good cached value.
+        Concurrent calls for the same currency share one in-flight fetch; a
+        cancelled caller leaves it running for the others.
+        """
+        inflight = self._inflight
+        task = inflight.get(src)
+        if task is None:
+            task = inflight[src] = asyncio.ensure_future(self._scrape(session, src))
+            task.add_done_callback(lambda _: inflight.pop(src, None))
+        return await asyncio.shield(task)
+
+    async def cancel_inflight(self) -> None:
+        """Cancel this provider's shared fetches and wait for them to unwind.
+
+        :meth:`scrape` shields them from its callers, so cancelling a caller
+        alone leaves them running.
+        """
+        tasks = list(self._inflight.values())
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _scrape(
+        self, session: aiohttp.ClientSession, src: str
+    ) -> Rate | None:
+        cache = self._rate_cache if self.cache_ttl else None
+        if cache is not None:
+            hit = cache.get(self.name, src, self.cache_ttl)
+            if hit is not None:
+                return self._make_rate(src, hit.rate, hit.fee)
         try:
-            result = await self.fetch_rate(session, src)
-            if result is None:
-                return None
-            if isinstance(result, (list, tuple)) and len(result) >= 2:
-                rate, fee = result[0], result[1]
-            else:
-                rate, fee = result, None
-            return Rate(
-                self.name, self.get_url(src), round(rate, 3), self.delivery,
-                fee=round(fee, 2) if fee is not None else None,
-            )
+            result = await asyncio.wait_for(self.fetch_rate(session, src), self.timeout)
+            if result is not None:
+                rate, fee = result if self.returns_fee else (result, None)
+                made = self._make_rate(src, rate, fee)
+                if cache is not None:
+                    cache.put(self.name, src, made.rate, made.fee)
+                return made
+        except asyncio.TimeoutError:
+            logger.error("  [%s] %s: timed out after %.0fs", self.name, src, self.timeout)
         except Exception as e:
             logger.error("  [%s] %s: %s", self.name, src, e)
-            return None
+        if cache is not None:
+            stale = cache.get(self.name, src, MAX_STALE_AGE)
+            if stale is not None:
+                logger.warning(
+                    "  [%s] %s: serving cached rate from %.0f min ago",
+                    self.name, src, (time.time() - stale.ts) / 60,
+                )
+                return self._make_rate(src, stale.rate, stale.fee)
+        return None
+
+    def _make_rate(self, src: str, rate: float, fee: float | None) -> Rate:
+        return Rate(
+            self.name, self._url_for(src), round(rate, 3), self.delivery,
+            fee=round(fee, 2) if fee is not None else None,
+        )
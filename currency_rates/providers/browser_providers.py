@@ -1,11 +1,32 @@
-"""Browser providers: scrape rates via Playwright (JS-rendered pages)."""
+"""Browser providers: scrape rates via Playwright (JS-rendered pages).
+
+Each provider first tries a plain HTTP GET and regexes the server-rendered
+text; Chromium is only used when the rate is not in the raw HTML.
+"""
 from __future__ import annotations
 
 import asyncio
+import re
 from typing import ClassVar
 
+import aiohttp
+
+from currency_rates.html_text import html_to_text
 from currency_rates.providers.base import Provider
 
+_PROBE_TIMEOUT = aiohttp.ClientTimeout(total=5)
+
+
+async def _fetch_text(session: aiohttp.ClientSession, url: str) -> str | None:
+    """Return the visible text of *url* as served (no JS), or ``None`` on any failure."""
+    try:
+        async with session.get(url, timeout=_PROBE_TIMEOUT) as r:
+            if r.status != 200:
+                return None
+            return html_to_text(await r.text())
+    except (aiohttp.ClientError, asyncio.TimeoutError, UnicodeDecodeError):
+        return None
+
 
 class WesternUnion(Provider):
     """Scrapes WU currency converter via Playwright (JS-rendered)."""
@@ -15,25 +36,34 @@ class WesternUnion(Provider):
     delivery = "Bank, Cash Pickup, Mobile Wallet"
 
     uses_browser: ClassVar[bool] = True
+    cache_ttl = 1800
+    timeout = 30.0
 
     _REGIONS: ClassVar[dict[str, str]] = {
         "USD": "us", "GBP": "gb", "EUR": "de", "CAD": "ca", "AUD": "au",
         "SGD": "sg", "JPY": "jp",
     }
+    _PATTERNS: ClassVar[dict[str, re.Pattern[str]]] = {
+        src: re.compile(rf"FX:\s*1\.00\s*{src}\s*[–\-]\s*([\d,]+\.\d+)\s*BDT")
+        for src in _REGIONS
+    }
+    _JS: ClassVar[dict[str, str]] = {
+        src: "() => { const m = document.body.innerText.match(/FX:\\s*1\\.00\\s*%s\\s*[–\\-]\\s*([\\d,]+\\.\\d+)\\s*BDT/); return m ? parseFloat(m[1].replace(/,/g,'')) : null; }" % src
+        for src in _REGIONS
+    }
 
     async def fetch_rate(self, session, src):
         if src not in self._REGIONS:
             return None
-        region = self._REGIONS[src]
-        url = (
-            f"https://www.westernunion.com/{region}/en/"
-            f"currency-converter/{src.lower()}-to-bdt-rate.html"
-        )
-        js = "() => { const m = document.body.innerText.match(/FX:\\s*1\\.00\\s*%s\\s*[–\\-]\\s*([\\d,]+\\.\\d+)\\s*BDT/); return m ? parseFloat(m[1].replace(/,/g,'')) : null; }" % src
+        url = self._url_for(src)
+        text = await _fetch_text(session, url)
+        m = self._PATTERNS[src].search(text) if text else None
+        if m:
+            return float(m.group(1).replace(",", ""))
         async with self._pool.page() as page:
             await page.goto(url, wait_until="domcontentloaded", timeout=8000)
             try:
-                h = await page.wait_for_function(js, timeout=4000)
+                h = await page.wait_for_function(self._JS[src], timeout=4000)
                 return await h.json_value()
             except Exception:
                 return None
@@ -54,21 +84,32 @@ class WorldRemit(Provider):
     delivery = "Bank, Mobile Wallet, Cash Pickup"
 
     uses_browser: ClassVar[bool] = True
+    cache_ttl = 1800
+    timeout = 30.0
 
     _REGIONS: ClassVar[dict[str, str]] = {
         "USD": "en-us", "GBP": "en-gb", "CAD": "en-ca", "AUD": "en-au",
     }
+    _PATTERNS: ClassVar[dict[str, re.Pattern[str]]] = {
+        src: re.compile(rf"1\s*{src}\s*=\s*([\d,]+\.\d+)\s*BDT") for src in _REGIONS
+    }
+    _JS: ClassVar[dict[str, str]] = {
+        src: "() => { const m = document.body.innerText.match(/1\\s*%s\\s*=\\s*([\\d,]+\\.\\d+)\\s*BDT/); return m ? parseFloat(m[1].replace(/,/g,'')) : null; }" % src
+        for src in _REGIONS
+    }
 
     async def fetch_rate(self, session, src):
-        region = self._REGIONS.get(src)
-        if not region:
+        if src not in self._REGIONS:
             return None
-        url = f"https://www.worldremit.com/{region}/bangladesh"
-        js = "() => { const m = document.body.innerText.match(/1\\s*%s\\s*=\\s*([\\d,]+\\.\\d+)\\s*BDT/); return m ? parseFloat(m[1].replace(/,/g,'')) : null; }" % src
+        url = self._url_for(src)
+        text = await _fetch_text(session, url)
+        m = self._PATTERNS[src].search(text) if text else None
+        if m:
+            return float(m.group(1).replace(",", ""))
         async with self._pool.page() as page:
             await page.goto(url, wait_until="domcontentloaded", timeout=8000)
             try:
-                h = await page.wait_for_function(js, timeout=4000)
+                h = await page.wait_for_function(self._JS[src], timeout=4000)
                 return await h.json_value()
             except Exception:
                 return None
@@ -86,21 +127,31 @@ class Xoom(Provider):
     delivery = "Bank, Cash Pickup, Mobile Wallet"
 
     uses_browser: ClassVar[bool] = True
+    cache_ttl = 1800
+    timeout = 30.0
 
+    _RATE_RE = re.compile(r"1\s+([A-Z]{3})\s*=\s*([\d,]+\.\d+)\s*BDT")
     _JS = "() => { const m = document.body.innerText.match(/1\\s+([A-Z]{3})\\s*=\\s*([\\d,]+\\.\\d+)\\s*BDT/); return m ? [m[1], parseFloat(m[2].replace(/,/g,''))] : null; }"
 
     def __init__(self):
+        super().__init__()
         self._cache: dict[str, float] = {}
         self._loaded = False
         self._load_lock = asyncio.Lock()
         self._pool = None
 
-    async def _load(self) -> None:
+    async def _load(self, session: aiohttp.ClientSession) -> None:
         if self._loaded:
             return
         async with self._load_lock:
             if self._loaded:
                 return
+            text = await _fetch_text(session, self.url)
+            m = self._RATE_RE.search(text) if text else None
+            if m:
+                self._cache[m.group(1)] = float(m.group(2).replace(",", ""))
+                self._loaded = True
+                return
             async with self._pool.page() as page:
                 await page.goto(self.url, wait_until="domcontentloaded", timeout=8000)
                 try:
@@ -113,5 +164,5 @@ class Xoom(Provider):
             self._loaded = True
 
     async def fetch_rate(self, session, src):
-        await self._load()
+        await self._load(session)
         return self._cache.get(src)
@@ -1,13 +1,16 @@
 """HTTP-only providers: scrape rates via aiohttp without a browser."""
 from __future__ import annotations
 
+import asyncio
 import re
 from typing import ClassVar
 
 import aiohttp
-from bs4 import BeautifulSoup
+import orjson
 
-from currency_rates.config import TARGET, TIMEOUT
+from currency_rates.config import CURRENCY_CODES, TARGET, TIMEOUT
+from currency_rates.html_text import BDT_NUMBER_RE, html_to_text
+from currency_rates.http_client import cached_json
 from currency_rates.providers.base import Provider
 
 
@@ -15,19 +18,25 @@ class Wise(Provider):
     name = "Wise"
     url = "https://wise.com/us/currency-converter/usd-to-bdt-rate"
     delivery = "Bank"
+    cache_ttl = 120
+    concurrency = 10
 
     _REGIONS: ClassVar[dict[str, str]] = {
         "USD": "us", "GBP": "gb", "EUR": "de", "CAD": "ca", "AUD": "au",
         "SGD": "sg", "AED": "ae", "MYR": "my", "SAR": "sa", "KWD": "kw",
         "QAR": "qa", "JPY": "jp", "NZD": "nz", "BHD": "bh", "OMR": "om",
     }
+    _LIVE_URLS: ClassVar[dict[str, str]] = {
+        code: f"https://wise.com/rates/live?source={code}&target={TARGET}"
+        for code in CURRENCY_CODES
+    }
 
     async def fetch_rate(self, session, src):
-        url = f"https://wise.com/rates/live?source={src}&target={TARGET}"
+        url = self._LIVE_URLS.get(src) or f"https://wise.com/rates/live?source={src}&target={TARGET}"
         async with session.get(url, timeout=TIMEOUT) as r:
             if r.status != 200:
                 return None
-            data = await r.json(content_type=None)
+            data = orjson.loads(await r.read())
             return data.get("value")
 
     def get_url(self, src):
@@ -39,6 +48,7 @@ class Remitly(Provider):
     name = "Remitly"
     url = "https://www.remitly.com/us/en/bangladesh"
     delivery = "Bank, Mobile Wallet, Cash Pickup"
+    cache_ttl = 600
 
     _REGIONS: ClassVar[dict[str, tuple[str, str]]] = {
         "USD": ("us", "en"), "GBP": ("gb", "en"), "EUR": ("de", "en"),
@@ -46,20 +56,19 @@ class Remitly(Provider):
     }
 
     async def fetch_rate(self, session, src):
-        region = self._REGIONS.get(src)
-        if not region:
+        if src not in self._REGIONS:
             return None
-        country, lang = region
-        url = f"https://www.remitly.com/{country}/{lang}/bangladesh"
-        async with session.get(url, timeout=TIMEOUT) as r:
+        async with session.get(self._url_for(src), timeout=TIMEOUT) as r:
             if r.status != 200:
                 return None
-            html = await r.text()
-            text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
-            matches = re.findall(r"(\d{2,4}\.\d{1,6})\s*BDT", text)
-            if not matches:
-                return None
-            return max(float(m) for m in matches)
+            body = await r.read()
+        # Most regional pages without a BDT corridor never mention it; skip the text pass.
+        if b"BDT" not in body:
+            return None
+        matches = BDT_NUMBER_RE.findall(html_to_text(body.decode("utf-8", "replace")))
+        if not matches:
+            return None
+        return max(map(float, matches))
 
     def get_url(self, src):
         country, lang = self._REGIONS.get(src, ("us", "en"))
@@ -70,6 +79,7 @@ class TapTapSend(Provider):
     name = "TapTapSend"
     url = "https://www.taptapsend.com/send-money-to/bangladesh"
     delivery = "Bank, Mobile Wallet"
+    concurrency = 1
 
     _API = "https://api.taptapsend.com/api/fxRates"
     _API_HEADERS: ClassVar[dict[str, str]] = {
@@ -77,27 +87,48 @@ class TapTapSend(Provider):
         "X-Device-Id": "web",
         "X-Device-Model": "web",
     }
+    # The fxRates payload covers every corridor; reuse it for runs this close together.
+    _RESPONSE_TTL = 600
+    _WANTED: ClassVar[frozenset[str]] = frozenset(CURRENCY_CODES)
 
     def __init__(self):
-        self._cache: dict[str, float] | None = None
+        super().__init__()
+        self._task: asyncio.Task[dict[str, float] | None] | None = None
 
     async def _load(self, session: aiohttp.ClientSession) -> dict[str, float]:
-        if self._cache is not None:
-            return self._cache
+        # One request serves every currency; concurrent callers await the same task.
+        task = self._task
+        if task is None:
+            task = self._task = asyncio.ensure_future(self._fetch_rates(session))
+        try:
+            rates = await asyncio.shield(task)
+        except Exception:
+            if self._task is task:
+                self._task = None
+            raise
+        if rates is None:
+            # Non-200: do not keep the miss, let the next call retry.
+            if self._task is task:
+                self._task = None
+            return {}
+        return rates
+
+    async def _fetch_rates(self, session: aiohttp.ClientSession) -> dict[str, float] | None:
+        data = await cached_json(session, self._API, self._RESPONSE_TTL, self._API_HEADERS)
+        if data is None:
+            return None
         rates: dict[str, float] = {}
-        async with session.get(self._API, headers=self._API_HEADERS,
-                               timeout=TIMEOUT) as r:
-            if r.status != 200:
-                return rates
-            data = await r.json(content_type=None)
-            for country in data.get("availableCountries", []):
-                cur = country["currency"]
-                for corridor in country.get("corridors", []):
-                    if corridor.get("currency") == TARGET:
-                        rate = float(corridor["fxRate"])
-                        if cur not in rates or rate > rates[cur]:
-                            rates[cur] = rate
-        self._cache = rates
+        for country in data.get("availableCountries", ()):
+            cur = country["currency"]
+            if cur not in self._WANTED:
+                continue
+            for corridor in country.get("corridors", ()):
+                if corridor.get("currency") != TARGET:
+                    continue
+                rate = float(corridor["fxRate"])
+                prev = rates.get(cur)
+                if prev is None or rate > prev:
+                    rates[cur] = rate
         return rates
 
     async def fetch_rate(self, session, src):
@@ -108,25 +139,41 @@ class Nala(Provider):
     name = "NALA"
     url = "https://www.nala.com/country/bangladesh"
     delivery = "Bank, Mobile Wallet"
+    concurrency = 1
 
     _API = "https://partners-api.prod.nala-api.com/v1/fx/rates"
 
     def __init__(self):
-        self._cache: dict[str, float] | None = None
+        super().__init__()
+        self._task: asyncio.Task[dict[str, float] | None] | None = None
 
     async def _load(self, session: aiohttp.ClientSession) -> dict[str, float]:
-        if self._cache is not None:
-            return self._cache
-        rates: dict[str, float] = {}
+        # Same single-flight scheme as TapTapSend: one request, shared by every caller.
+        task = self._task
+        if task is None:
+            task = self._task = asyncio.ensure_future(self._fetch_rates(session))
+        try:
+            rates = await asyncio.shield(task)
+        except Exception:
+            if self._task is task:
+                self._task = None
+            raise
+        if rates is None:
+            if self._task is task:
+                self._task = None
+            return {}
+        return rates
+
+    async def _fetch_rates(self, session: aiohttp.ClientSession) -> dict[str, float] | None:
         async with session.get(self._API, timeout=TIMEOUT) as r:
             if r.status != 200:
-                return rates
-            data = await r.json(content_type=None)
-            for entry in data.get("data", []):
-                if (entry.get("destination_currency") == TARGET
-                        and entry.get("provider_name") == "NALA"):
-                    rates[entry["source_currency"]] = float(entry["rate"])
-        self._cache = rates
+                return None
+            data = orjson.loads(await r.read())
+        rates: dict[str, float] = {}
+        for entry in data.get("data", ()):
+            if (entry.get("destination_currency") == TARGET
+                    and entry.get("provider_name") == "NALA"):
+                rates[entry["source_currency"]] = float(entry["rate"])
         return rates
 
     async def fetch_rate(self, session, src):
@@ -137,11 +184,15 @@ class Instarem(Provider):
     name = "Instarem"
     url = "https://www.instarem.com/en-us/currency-conversion/usd-to-bdt/"
     delivery = "Bank"
+    cache_ttl = 300
+    concurrency = 6
 
     _API = "https://www.instarem.com/wp-json/instarem/v2/convert-rate"
 
     def __init__(self):
-        self._cache: dict[str, float] = {}
+        super().__init__()
+        # None marks a corridor the API answered without a BDT rate; HTTP errors are not kept.
+        self._cache: dict[str, float | None] = {}
 
     async def fetch_rate(self, session, src):
         if src in self._cache:
@@ -150,18 +201,21 @@ class Instarem(Provider):
         async with session.get(url, timeout=TIMEOUT) as r:
             if r.status != 200:
                 return None
-            data = await r.json(content_type=None)
-            rates = data.get("data", {}) if data.get("status") else data
-            bdt = rates.get(TARGET)
-            if bdt is not None:
-                self._cache[src] = float(bdt)
-                return self._cache[src]
-        return None
+            data = orjson.loads(await r.read())
+        rates = data.get("data", {}) if data.get("status") else data
+        bdt = rates.get(TARGET)
+        rate = self._cache[src] = float(bdt) if bdt is not None else None
+        return rate
 
     def get_url(self, src):
         return f"https://www.instarem.com/en-us/currency-conversion/{src.lower()}-to-bdt/"
 
 
+def _xe_pattern(code: str) -> re.Pattern[str]:
+    """Pattern for "1 SRC = X BDT" or "1.00 SRC = X BDT", matched in one pass."""
+    return re.compile(rf"1(?:\.0+)?\s+{re.escape(code)}\s*\\?=\s*([\d.,]+)\s*BDT")
+
+
 class Xe(Provider):
     """Scrapes Xe currency converter (mid-market rate; they also offer send-money to Bangladesh)."""
 
@@ -169,29 +223,31 @@ class Xe(Provider):
     url = "https://www.xe.com/currencyconverter/convert/?Amount=1&From=USD&To=BDT"
     delivery = "Bank"
 
+    _PATTERNS: ClassVar[dict[str, re.Pattern[str]]] = {
+        code: _xe_pattern(code) for code in CURRENCY_CODES
+    }
+
     async def fetch_rate(self, session, src):
         url = f"https://www.xe.com/currencyconverter/convert/?Amount=1&From={src}&To=BDT"
         async with session.get(url, timeout=TIMEOUT) as r:
             if r.status != 200:
                 return None
-            html = await r.text()
-            text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
-            for pat in (
-                rf"1\.0+\s+{re.escape(src)}\s*\\?=\s*([\d.,]+)\s*BDT",
-                rf"1\s+{re.escape(src)}\s*\\?=\s*([\d.,]+)\s*BDT",
-            ):
-                m = re.search(pat, text)
-                if m:
-                    try:
-                        rate = float(m.group(1).replace(",", ""))
-                    except (ValueError, TypeError):
-                        continue
-                    if src == "JPY":
-                        if 0.1 < rate < 2:
-                            return rate
-                    elif 5 < rate < 1000:
-                        return rate
+            body = await r.read()
+        # The rate patterns need a literal "BDT"; pages without one cannot match.
+        if b"BDT" not in body:
+            return None
+        text = html_to_text(body.decode("utf-8", "replace"))
+        # First match in document order only, whether written "1 SRC" or "1.00 SRC".
+        m = (self._PATTERNS.get(src) or _xe_pattern(src)).search(text)
+        if not m:
             return None
+        try:
+            rate = float(m.group(1).replace(",", ""))
+        except ValueError:
+            return None
+        if src == "JPY":
+            return rate if 0.1 < rate < 2 else None
+        return rate if 5 < rate < 1000 else None
 
     def get_url(self, src):
         return f"https://www.xe.com/currencyconverter/convert/?Amount=1&From={src}&To=BDT"
@@ -208,6 +264,17 @@ class OrbitRemit(Provider):
         "AUD": "aud-to-bdt",
         "NZD": "nzd-to-bdt",
     }
+    _RATE_PATTERNS: ClassVar[dict[str, re.Pattern[str]]] = {
+        src: re.compile(rf"1\s+{src}\s*=\s*([\d,.]+)\s*BDT", re.I)
+        for src in _CURRENCIES
+    }
+    _AMOUNT_PATTERNS: ClassVar[dict[str, tuple[tuple[int, re.Pattern[str]], ...]]] = {
+        src: tuple(
+            (amount, re.compile(rf"{amount}\s+{src}\s+([\d,.]+)\s*BDT", re.I))
+            for amount in (5, 10, 1)
+        )
+        for src in _CURRENCIES
+    }
 
     async def fetch_rate(self, session, src):
         path = self._CURRENCIES.get(src)
@@ -218,14 +285,14 @@ class OrbitRemit(Provider):
             if r.status != 200:
                 return None
             html = await r.text()
-            text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
-            m = re.search(rf"1\s+{src}\s*=\s*([\d,.]+)\s*BDT", text, re.I)
+            text = html_to_text(html)
+            m = self._RATE_PATTERNS[src].search(text)
             if m:
                 rate = float(m.group(1).replace(",", ""))
                 if 50 < rate < 200 or (0.1 < rate < 2 and src == "NZD"):
                     return rate
-            for amount in (5, 10, 1):
-                m = re.search(rf"{amount}\s+{src}\s+([\d,.]+)\s*BDT", text, re.I)
+            for amount, pat in self._AMOUNT_PATTERNS[src]:
+                m = pat.search(text)
                 if m:
                     bdt = float(m.group(1).replace(",", ""))
                     rate = bdt / amount
@@ -233,11 +300,11 @@ class OrbitRemit(Provider):
                         return rate
                     if 50 < rate < 100 and src == "NZD":
                         return rate
-            matches = re.findall(r"(\d{2,4}\.\d{1,6})\s*BDT", text)
-            valid = [float(x) for x in matches if 80 < float(x) < 95]
+            matches = BDT_NUMBER_RE.findall(text)
+            valid = [v for v in map(float, matches) if 80 < v < 95]
             if valid and src == "AUD":
                 return min(valid)
-            valid = [float(x) for x in matches if 50 < float(x) < 200]
+            valid = [v for v in map(float, matches) if 50 < v < 200]
             return min(valid) if valid else None
 
     def get_url(self, src):
@@ -249,6 +316,8 @@ class SendWave(Provider):
     name = "SendWave"
     url = "https://www.sendwave.com/en/currency-converter/usd_us-bdt_bd"
     delivery = "Bank, Mobile Wallet"
+    cache_ttl = 300
+    returns_fee = True
 
     _API = "https://app.sendwave.com/v2/pricing-public"
     _CORRIDORS: ClassVar[dict[str, tuple[str, str]]] = {
@@ -272,7 +341,7 @@ class SendWave(Provider):
         async with session.get(self._API, params=params, timeout=TIMEOUT) as r:
             if r.status != 200:
                 return None
-            data = await r.json(content_type=None)
+            data = orjson.loads(await r.read())
             rate = data.get("baseExchangeRate")
             fee_str = data.get("baseFeeAmount")
             if not rate:
@@ -292,6 +361,8 @@ class Paysend(Provider):
     name = "Paysend"
     url = "https://paysend.com/en-us/send-money/from-the-united-states-of-america-to-bangladesh"
     delivery = "Bank, Card"
+    cache_ttl = 300
+    returns_fee = True
 
     _REGIONS: ClassVar[dict[str, tuple[str, str]]] = {
         "USD": ("en-us", "the-united-states-of-america"),
@@ -299,6 +370,10 @@ class Paysend(Provider):
         "CAD": ("en-ca", "canada"),
         "AUD": ("en-au", "australia"),
     }
+    _RATE_PATTERNS: ClassVar[dict[str, re.Pattern[str]]] = {
+        src: re.compile(rf"1\.00\s+{src}\s*=\s*([\d.]+)\s*BDT") for src in _REGIONS
+    }
+    _FEE_RE = re.compile(r"Fee:\s*([\d.]+)\s*(?:USD|EUR|GBP|CAD|AUD)")
 
     async def fetch_rate(self, session, src):
         region = self._REGIONS.get(src)
@@ -309,15 +384,17 @@ class Paysend(Provider):
         async with session.get(url, timeout=TIMEOUT) as r:
             if r.status != 200:
                 return None
-            html = await r.text()
-            text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
-            m = re.search(rf"1\.00\s+{src}\s*=\s*([\d.]+)\s*BDT", text)
-            if not m:
-                return None
-            rate = float(m.group(1))
-            fee_m = re.search(r"Fee:\s*([\d.]+)\s*(?:USD|EUR|GBP|CAD|AUD)", text)
-            fee = float(fee_m.group(1)) if fee_m else None
-            return (rate, fee)
+            body = await r.read()
+        if b"BDT" not in body:
+            return None
+        text = html_to_text(body.decode("utf-8", "replace"))
+        m = self._RATE_PATTERNS[src].search(text)
+        if not m:
+            return None
+        rate = float(m.group(1))
+        fee_m = self._FEE_RE.search(text)
+        fee = float(fee_m.group(1)) if fee_m else None
+        return (rate, fee)
 
     def get_url(self, src):
         region = self._REGIONS.get(src, ("en-us", "the-united-states-of-america"))
@@ -20,6 +20,7 @@ class Ria(Provider):
     }
 
     def __init__(self):
+        super().__init__()
         self._scrapling_cache = {}
 
     async def fetch_rate(self, session, src):
@@ -44,6 +45,7 @@ class MoneyGram(Provider):
     uses_scrapling: ClassVar[bool] = True
 
     def __init__(self):
+        super().__init__()
         self._scrapling_cache = {}
 
     async def fetch_rate(self, session, src):
@@ -62,6 +64,7 @@ class Nsave(Provider):
     uses_scrapling: ClassVar[bool] = True
 
     def __init__(self):
+        super().__init__()
         self._scrapling_cache = {}
 
     async def fetch_rate(self, session, src):
@@ -0,0 +1,88 @@
+"""RateCache: last good rate per (provider, source currency), persisted between runs."""
+from __future__ import annotations
+
+import logging
+import os
+import time
+from dataclasses import asdict, dataclass
+from pathlib import Path
+
+import orjson
+
+logger = logging.getLogger(__name__)
+
+# A failed fetch may fall back to a cached rate at most this old (seconds).
+MAX_STALE_AGE = 6 * 60 * 60
+
+
+@dataclass
+class CachedRate:
+    rate: float
+    fee: float | None
+    ts: float
+
+
+def _is_number(value) -> bool:
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _parse_entry(value) -> CachedRate | None:
+    """Build a CachedRate from one JSON entry, or ``None`` if it is malformed."""
+    if not isinstance(value, dict):
+        return None
+    rate, fee, ts = value.get("rate"), value.get("fee"), value.get("ts")
+    if not (_is_number(rate) and _is_number(ts) and (fee is None or _is_number(fee))):
+        return None
+    return CachedRate(float(rate), float(fee) if fee is not None else None, float(ts))
+
+
+class RateCache:
+    """JSON-file cache of scraped rates keyed by ``"provider:SRC"``.
+
+    Entries are only replaced by successful fetches, so a provider that fails
+    transiently keeps serving its previous value until it is ``MAX_STALE_AGE`` old.
+    """
+
+    def __init__(self, path: Path):
+        self._path = path
+        self._entries: dict[str, CachedRate] = {}
+        self._dirty = False
+
+    def load(self) -> None:
+        try:
+            raw = orjson.loads(self._path.read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:
+            logger.warning("  [cache] ignoring unreadable %s: %s", self._path.name, e)
+            return
+        if not isinstance(raw, dict):
+            logger.warning("  [cache] ignoring malformed %s", self._path.name)
+            return
+        for key, value in raw.items():
+            entry = _parse_entry(value)
+            if entry is None:
+                logger.warning("  [cache] dropping malformed entry %s", key)
+            else:
+                self._entries[key] = entry
+
+    def save(self) -> None:
+        if not self._dirty:
+            return
+        data = {k: asdict(v) for k, v in self._entries.items()}
+        # Same tmp-and-rename as rates.json, so a killed run never leaves half a cache.
+        tmp = self._path.with_name(self._path.name + ".tmp")
+        tmp.write_bytes(orjson.dumps(data))
+        os.replace(tmp, self._path)
+        self._dirty = False
+
+    def get(self, provider: str, src: str, max_age: float) -> CachedRate | None:
+        """Return the entry for (*provider*, *src*) if younger than *max_age* seconds."""
+        entry = self._entries.get(f"{provider}:{src}")
+        if entry is None or time.time() - entry.ts > max_age:
+            return None
+        return entry
+
+    def put(self, provider: str, src: str, rate: float, fee: float | None) -> None:
+        self._entries[f"{provider}:{src}"] = CachedRate(rate, fee, time.time())
+        self._dirty = True
@@ -2,16 +2,19 @@ from __future__ import annotations
 
 import asyncio
 import logging
-import ssl
-from dataclasses import asdict
+from collections import defaultdict
+from collections.abc import Sequence
+from contextlib import asynccontextmanager, nullcontext
 from datetime import datetime, timezone
+from operator import itemgetter
 
 import aiohttp
-import certifi
 
-from currency_rates.config import CURRENCIES, HEADERS, TARGET
+from currency_rates.config import CURRENCY_CODES, RATE_CACHE_PATH, TARGET
 from currency_rates.models import Rate
 from currency_rates.browser_pool import BrowserPool
+from currency_rates.http_client import create_session
+from currency_rates.rate_cache import RateCache
 from currency_rates.scrapling_fetch import scrapling_stealthy_batch_sync, scrapling_nsave_sync
 from currency_rates.providers import PROVIDERS
 from currency_rates.providers.base import Provider
@@ -19,80 +22,128 @@ from currency_rates.providers.base import Provider
 logger = logging.getLogger(__name__)
 
 
+class _Limiter:
+    """Caps concurrent scrapes overall and per provider class (its ``concurrency``)."""
+
+    def __init__(self, total: int = 50):
+        self._total = asyncio.Semaphore(total)
+        self._providers: dict[type[Provider], asyncio.Semaphore] = {}
+
+    @asynccontextmanager
+    async def slot(self, provider: Provider):
+        key = type(provider)
+        sem = self._providers.get(key)
+        if sem is None:
+            sem = self._providers[key] = asyncio.Semaphore(provider.concurrency)
+        async with self._total, sem:
+            yield
+
+
 async def _fetch_one(
-    session: aiohttp.ClientSession, provider: Provider, code: str
+    session: aiohttp.ClientSession, provider: Provider, code: str,
+    limiter: _Limiter | None = None,
 ) -> tuple[str, Rate | None]:
-    result = await provider.scrape(session, code)
+    # scrape() applies the provider timeout itself so its stale-cache fallback still runs;
+    # anything escaping it must not take the rest of the run down.
+    try:
+        async with limiter.slot(provider) if limiter is not None else nullcontext():
+            result = await provider.scrape(session, code)
+    except Exception as e:
+        logger.error("  [%s] %s: %s", provider.name, code, e)
+        result = None
     tag = f"✅ {result.provider}: {result.rate}" if result else f"❌ {provider.name}"
-    logger.info(f"  {code}: {tag}")
+    logger.info("  %s: %s", code, tag)
     return (code, result)
 
 
-async def fetch_all(providers: list[Provider] | None = None) -> dict:
+async def _cancel_pending(tasks: list[asyncio.Task], providers: Sequence[Provider]) -> None:
+    """Cancel unfinished runner tasks and the shared provider fetches behind them."""
+    for task in tasks:
+        task.cancel()
+    await asyncio.gather(*tasks, return_exceptions=True)
+    await asyncio.gather(*(p.cancel_inflight() for p in providers))
+
+
+async def fetch_all(
+    providers: Sequence[Provider] | None = None,
+    session: aiohttp.ClientSession | None = None,
+    now: datetime | None = None,
+) -> dict:
+    """Scrape every provider for every currency.
+
+    Pass *session* to reuse one connection pool across runs; otherwise a
+    session is created for this run and closed afterwards. *now* stamps
+    ``updated_at`` (default: the current UTC time).
+    """
     logger = logging.getLogger(__name__)
-    now = datetime.now(timezone.utc).isoformat()
-    data: dict[str, list[dict]] = {code: [] for code, *_ in CURRENCIES}
+    if now is None:
+        now = datetime.now(timezone.utc)
+    buckets: defaultdict[str, list[dict]] = defaultdict(list)
 
     if providers is None:
         providers = PROVIDERS
 
     # Create dependencies locally — NO module-level globals
     pool = BrowserPool()
+    limiter = _Limiter()
     scrapling_cache: dict = {}
+    rate_cache = RateCache(RATE_CACHE_PATH)
+    rate_cache.load()
 
-    # Wire dependencies into providers
+    # Wire dependencies into providers and classify them by dispatch type
+    # (using class attrs, NOT isinstance) in the same pass
+    http_providers: list[Provider] = []
+    browser_providers: list[Provider] = []
     for p in providers:
-        if p.uses_browser:
-            p._pool = pool
+        p._rate_cache = rate_cache
         if p.uses_scrapling:
             p._scrapling_cache = scrapling_cache
-
-    ssl_ctx = ssl.create_default_context(cafile=certifi.where())
-    conn = aiohttp.TCPConnector(ssl=ssl_ctx)
-    async with aiohttp.ClientSession(headers=HEADERS, connector=conn) as session:
-        # Classify providers by dispatch type (using class attrs, NOT isinstance)
-        http_tasks = [
-            _fetch_one(session, p, code)
-            for code, *_ in CURRENCIES
-            for p in providers
-            if not p.uses_browser and not p.uses_scrapling
-        ]
-        browser_tasks = [
-            _fetch_one(session, p, code)
-            for code, *_ in CURRENCIES
-            for p in providers
-            if p.uses_browser
-        ]
-        batch_task = asyncio.create_task(asyncio.to_thread(scrapling_stealthy_batch_sync, scrapling_cache))
-        nsave_task = asyncio.create_task(
-            asyncio.wait_for(asyncio.to_thread(scrapling_nsave_sync, scrapling_cache), timeout=14.0)
-        )
-
-        results = await asyncio.gather(
-            pool._start(),
-            *http_tasks,
-            *browser_tasks,
-            batch_task,
-            nsave_task,
-            return_exceptions=True,
-        )
-        n_main = 1 + len(http_tasks) + len(browser_tasks)
-        main_results = results[:n_main]
-        # nsave_result is the last item in results (check it's not an exception)
-        last = results[-1]
-        nsave_result = last if not isinstance(last, BaseException) else None
-
-    await pool.stop()
-
-    # Populate data from main_results (skip index 0 which is pool._start(), skip exceptions)
-    for i, r in enumerate(main_results):
-        if i == 0:
-            continue
-        if isinstance(r, BaseException):
-            continue
-        code, rate = r
-        if rate:
-            data[code].append(asdict(rate))
+        if p.uses_browser:
+            p._pool = pool
+            browser_providers.append(p)
+        elif not p.uses_scrapling:
+            http_providers.append(p)
+
+    tasks: list[asyncio.Task] = []
+    try:
+        async with create_session() if session is None else nullcontext(session) as session:
+            try:
+                # Chromium and one tab per browser provider warm up alongside the HTTP scrapes;
+                # browser providers wait on the launch via pool.page()
+                warmup_task = asyncio.create_task(pool.prewarm(len(browser_providers)))
+                http_tasks = [
+                    asyncio.create_task(_fetch_one(session, p, code, limiter))
+                    for code in CURRENCY_CODES
+                    for p in http_providers
+                ]
+                browser_tasks = [
+                    asyncio.create_task(_fetch_one(session, p, code, limiter))
+                    for code in CURRENCY_CODES
+                    for p in browser_providers
+                ]
+                batch_task = asyncio.create_task(asyncio.to_thread(scrapling_stealthy_batch_sync, scrapling_cache))
+                nsave_task = asyncio.create_task(
+                    asyncio.wait_for(asyncio.to_thread(scrapling_nsave_sync, scrapling_cache), timeout=14.0)
+                )
+                tasks = [warmup_task, *http_tasks, *browser_tasks, batch_task, nsave_task]
+
+                # Collect rates in completion order so a slow provider never holds back the rest
+                for fut in asyncio.as_completed([*http_tasks, *browser_tasks]):
+                    code, rate = await fut
+                    if rate:
+                        buckets[code].append(rate.to_dict())
+
+                _, _, nsave_result = await asyncio.gather(
+                    warmup_task, batch_task, nsave_task, return_exceptions=True,
+                )
+                if isinstance(nsave_result, BaseException):
+                    nsave_result = None
+            finally:
+                # Before the session closes: shielded provider fetches outlive their callers.
+                await _cancel_pending(tasks, providers)
+    finally:
+        await pool.stop()
+        rate_cache.save()
 
     # Write nsave result into cache (mirrors original: `if nsave_result is not None: _scrapling_cache["Nsave"] = nsave_result`)
     if nsave_result is not None:
@@ -102,22 +153,29 @@ async def fetch_all(providers: list[Provider] | None = None) -> dict:
     ria_p = next((p for p in providers if p.name == "Ria"), None)
     if ria_p:
         for src, rate in scrapling_cache.get("Ria", {}).items():
-            data[src].append(asdict(Rate(ria_p.name, ria_p.get_url(src), round(rate, 3), ria_p.delivery, fee=None)))
+            buckets[src].append(ria_p._make_rate(src, rate, None).to_dict())
 
     # Populate MoneyGram rate from cache
     mg_p = next((p for p in providers if p.name == "MoneyGram"), None)
     if mg_p and scrapling_cache.get("MoneyGram") is not None:
         r = scrapling_cache["MoneyGram"]
-        data["USD"].append(asdict(Rate(mg_p.name, mg_p.get_url("USD"), round(r, 3), mg_p.delivery, fee=None)))
+        buckets["USD"].append(mg_p._make_rate("USD", r, None).to_dict())
 
     # Populate Nsave rate from cache
     nsave_p = next((p for p in providers if p.name == "nsave"), None)
     if nsave_p and scrapling_cache.get("Nsave") is not None:
         r = scrapling_cache["Nsave"]
-        data["USD"].append(asdict(Rate(nsave_p.name, nsave_p.get_url("USD"), round(r, 3), nsave_p.delivery, fee=None)))
+        buckets["USD"].append(nsave_p._make_rate("USD", r, None).to_dict())
 
     # Sort each currency's rates descending (best first)
-    for code in data:
-        data[code].sort(key=lambda r: r["rate"], reverse=True)
-
-    return {"updated_at": now, "target": TARGET, "rates": data}
+    by_rate = itemgetter("rate")
+    data = {
+        code: sorted(buckets[code], key=by_rate, reverse=True)
+        for code in CURRENCY_CODES
+    }
+
+    return {
+        "updated_at": now.isoformat(),
+        "target": TARGET,
+        "rates": data,
+    }
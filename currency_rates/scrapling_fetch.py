@@ -7,11 +7,17 @@ functions to avoid a hard dependency at import time.
 """
 from __future__ import annotations
 
-import json
 import logging
 import re
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import ExitStack
+from pathlib import Path
+from typing import Callable
 
-from bs4 import BeautifulSoup
+import orjson
+
+from currency_rates.config import BROWSER_PROFILE_DIR
+from currency_rates.html_text import BDT_NUMBER_RE, html_to_text
 
 logger = logging.getLogger(__name__)
 
@@ -22,6 +28,21 @@ _RIA_VALID_RANGES = {
     "SAR": (28, 45), "KWD": (350, 450), "QAR": (28, 45), "JPY": (0.1, 2),
 }
 
+_RIA_JSON_LD_RE = re.compile(r'"price"\s*:\s*"([\d.]+)"\s*,?\s*"priceCurrency"\s*:\s*"BDT"')
+# Per currency: hero text "1.00 SRC = RATE BDT", then table row "1 SRC RATE BDT".
+_RIA_PATTERNS = {
+    src: (
+        re.compile(rf"1\.0*\s*{src}\s*=\s*([\d,.]+)\s*BDT", re.I),
+        re.compile(rf"1\s*{src}\s*([\d,.]+)\s*BDT", re.I),
+    )
+    for src in _RIA_VALID_RANGES
+}
+_RIA_FALLBACK_RE = re.compile(r"(?<![\d,])(\d{2,4}\.\d{1,6})\s*BDT")
+
+_NEXT_DATA_RE = re.compile(r'<script id="__NEXT_DATA__"[^>]*>([^<]+)</script>')
+_NUMERIC_RE = re.compile(r"^\d+\.?\d*$")
+_NSAVE_RE = re.compile(r"1\s*USD\s*[=:]\s*([\d,.]+)\s*BDT", re.I)
+
 
 def _valid_ria_rate(rate: float, src: str) -> bool:
     """Rate must fall within plausible BDT-per-unit range for the source currency."""
@@ -32,31 +53,32 @@ def _valid_ria_rate(rate: float, src: str) -> bool:
 def _parse_ria_from_html(html: str, src: str) -> float | None:
     """Parse Ria rate from HTML. Prefer JSON-LD, then explicit '1 SRC = RATE BDT', then table."""
     # 1. JSON-LD structured data (most reliable, always present in Ria pages)
-    m = re.search(r'"price"\s*:\s*"([\d.]+)"\s*,?\s*"priceCurrency"\s*:\s*"BDT"', html)
+    m = _RIA_JSON_LD_RE.search(html)
     if m:
         rate = float(m.group(1))
         if _valid_ria_rate(rate, src):
             return rate
 
-    text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
+    text = html_to_text(html)
+    hero_re, table_re = _RIA_PATTERNS[src]
 
     # 2. "1.00 SRC = RATE BDT" (hero text with currency code)
-    m = re.search(rf"1\.0*\s*{re.escape(src)}\s*=\s*([\d,.]+)\s*BDT", text, re.I)
+    m = hero_re.search(text)
     if m:
         rate = float(m.group(1).replace(",", ""))
         if _valid_ria_rate(rate, src):
             return rate
 
     # 3. Table row: "1 SRC RATE BDT" (no = sign, e.g. "1 USD123.48873 BDT")
-    m = re.search(rf"1\s*{re.escape(src)}\s*([\d,.]+)\s*BDT", text, re.I)
+    m = table_re.search(text)
     if m:
         rate = float(m.group(1).replace(",", ""))
         if _valid_ria_rate(rate, src):
             return rate
 
     # 4. Fallback: find standalone numbers (not fragments of larger comma-separated values)
-    matches = re.findall(r"(?<![\d,])(\d{2,4}\.\d{1,6})\s*BDT", text)
-    valid = [float(x) for x in matches if _valid_ria_rate(float(x), src)]
+    matches = _RIA_FALLBACK_RE.findall(text)
+    valid = [v for v in map(float, matches) if _valid_ria_rate(v, src)]
     return max(valid) if valid else None
 
 
@@ -68,77 +90,133 @@ def _scrapling_body(page) -> str:
     return body if isinstance(body, str) else ""
 
 
+def _find_rate_in_json(data: object) -> float | None:
+    """First number (or numeric string) in 50..200, depth-first in document order.
+
+    Iterative with an explicit stack: no recursion frames and no cycle tracking
+    (parsed JSON is a tree).
+    """
+    stack = [data]
+    while stack:
+        obj = stack.pop()
+        if isinstance(obj, dict):
+            stack.extend(reversed(obj.values()))
+        elif isinstance(obj, list):
+            stack.extend(reversed(obj))
+        elif isinstance(obj, (int, float)):
+            if 50 < obj < 200:
+                return float(obj)
+        elif isinstance(obj, str) and _NUMERIC_RE.match(obj):
+            v = float(obj)
+            if 50 < v < 200:
+                return v
+    return None
+
+
 def _parse_moneygram_from_html(html: str) -> float | None:
     """Parse MoneyGram USD->BDT rate from HTML (__NEXT_DATA__ or BDT text)."""
-    nd_match = re.search(r'<script id="__NEXT_DATA__"[^>]*>([^<]+)</script>', html)
+    nd_match = _NEXT_DATA_RE.search(html)
     if nd_match:
         try:
-            data = json.loads(nd_match.group(1))
-
-            def find_rate(obj, seen=None):
-                seen = seen or set()
-                if id(obj) in seen:
-                    return None
-                if isinstance(obj, (int, float)) and 50 < obj < 200:
-                    return float(obj)
-                if isinstance(obj, str) and re.match(r"^\d+\.?\d*$", obj):
-                    v = float(obj)
-                    if 50 < v < 200:
-                        return v
-                if isinstance(obj, dict):
-                    seen.add(id(obj))
-                    for k, v in obj.items():
-                        if "rate" in k.lower() and isinstance(v, (int, float)) and 50 < v < 200:
-                            return float(v)
-                        r = find_rate(v, seen)
-                        if r is not None:
-                            return r
-                if isinstance(obj, list):
-                    for item in obj:
-                        r = find_rate(item, seen)
-                        if r is not None:
-                            return r
-                return None
-
-            rate = find_rate(data)
+            rate = _find_rate_in_json(orjson.loads(nd_match.group(1)))
             if rate is not None:
                 return rate
-        except Exception:
+        except orjson.JSONDecodeError:
             pass
-    text = BeautifulSoup(html, "html.parser").get_text(" ", strip=True)
-    matches = re.findall(r"(\d{2,4}\.\d{1,6})\s*BDT", text)
-    valid = [float(x) for x in matches if 50 < float(x) < 200]
+    text = html_to_text(html)
+    matches = BDT_NUMBER_RE.findall(text)
+    valid = [v for v in map(float, matches) if 50 < v < 200]
     return min(valid) if valid else None
 
 
-def scrapling_stealthy_batch_sync(cache: dict) -> None:
-    """One StealthySession: fetch all Ria + MoneyGram; fill ``cache``. Uses Playwright Chromium."""
+def _clear_profile_locks(profile: Path) -> None:
+    """Remove Chromium's ``Singleton*`` lock files a killed run left in *profile*.
+
+    A restored profile still holding them makes every later launch fail.
+    """
+    for lock in profile.glob("Singleton*"):
+        try:
+            lock.unlink(missing_ok=True)
+        except OSError as e:
+            logger.warning("  [scrapling] could not remove %s: %s", lock, e)
+
+
+def _enter_session(stack: ExitStack, profile: Path | None):
+    """Start a StealthySession on *stack*, preferring the persistent *profile*.
+
+    Falls back to a fresh temporary profile if the persistent one cannot be used;
+    returns ``None`` (after logging) if no session starts at all.
+    """
+    from scrapling.fetchers import StealthySession
+    if profile is not None:
+        _clear_profile_locks(profile)
+        try:
+            return stack.enter_context(
+                StealthySession(headless=True, network_idle=False, user_data_dir=str(profile))
+            )
+        except Exception as e:
+            logger.warning("  [scrapling] profile %s unusable, using a fresh one: %s", profile.name, e)
+    try:
+        return stack.enter_context(StealthySession(headless=True, network_idle=False))
+    except Exception as e:
+        logger.error("  [scrapling] could not start a session: %s", e)
+        return None
+
+
+def _stealthy_worker(
+    jobs: list[tuple[str, Callable[[str], None]]], profile: Path | None = None,
+) -> None:
+    """Fetch each ``(url, on_html)`` job in one StealthySession; failures are per URL.
+
+    With *profile*, the session keeps cookies and HTTP cache in that directory
+    across runs instead of a fresh temporary one.
+    """
+    with ExitStack() as stack:
+        session = _enter_session(stack, profile)
+        if session is None:
+            return
+        for url, on_html in jobs:
+            try:
+                on_html(_scrapling_body(session.fetch(url)))
+            except Exception as e:
+                logger.warning("  [scrapling] %s: %s", url, e)
+
+
+def scrapling_stealthy_batch_sync(cache: dict, workers: int = 3) -> None:
+    """Fetch all Ria + MoneyGram pages; fill ``cache``. Uses Playwright Chromium.
+
+    The URLs are spread round-robin over *workers* StealthySessions running in
+    parallel threads, so wall time is roughly 1/workers of a single session.
+    Each worker reuses its own profile under ``BROWSER_PROFILE_DIR``.
+    """
     cache["Ria"] = {}
     cache["MoneyGram"] = None
     cache["Nsave"] = None
     try:
-        from scrapling.fetchers import StealthySession
+        import scrapling.fetchers  # noqa: F401
     except ImportError:
         return
-    ria_currencies = {"USD", "GBP", "EUR", "CAD", "AUD", "SGD", "AED", "SAR", "JPY"}
-    try:
-        with StealthySession(headless=True, network_idle=False) as session:
-            for src in ria_currencies:
-                url = f"https://www.riamoneytransfer.com/en-us/rates-conversion/?From={src}&To=BDT&Amount=1"
-                try:
-                    page = session.fetch(url)
-                    rate = _parse_ria_from_html(_scrapling_body(page), src)
-                    if rate is not None:
-                        cache["Ria"][src] = rate
-                except Exception:
-                    pass
-            try:
-                page = session.fetch("https://www.moneygram.com/us/en/corridor/bangladesh")
-                cache["MoneyGram"] = _parse_moneygram_from_html(_scrapling_body(page))
-            except Exception:
-                pass
-    except Exception:
-        pass
+    ria_currencies = ["USD", "GBP", "EUR", "CAD", "AUD", "SGD", "AED", "SAR", "JPY"]
+
+    def ria_job(src: str) -> tuple[str, Callable[[str], None]]:
+        def on_html(html: str) -> None:
+            rate = _parse_ria_from_html(html, src)
+            if rate is not None:
+                cache["Ria"][src] = rate
+        url = f"https://www.riamoneytransfer.com/en-us/rates-conversion/?From={src}&To=BDT&Amount=1"
+        return url, on_html
+
+    def on_moneygram(html: str) -> None:
+        cache["MoneyGram"] = _parse_moneygram_from_html(html)
+
+    jobs = [ria_job(src) for src in ria_currencies]
+    jobs.append(("https://www.moneygram.com/us/en/corridor/bangladesh", on_moneygram))
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        list(pool.map(
+            _stealthy_worker,
+            [jobs[i::workers] for i in range(workers)],
+            [BROWSER_PROFILE_DIR / f"stealthy-{i}" for i in range(workers)],
+        ))
 
 
 def scrapling_nsave_sync(cache: dict) -> float | None:
@@ -151,13 +229,13 @@ def scrapling_nsave_sync(cache: dict) -> float | None:
         page = DynamicFetcher.fetch("https://www.nsave.com/calculator/usd-bdt", headless=True, network_idle=False)
     except Exception:
         return None
-    text = BeautifulSoup(_scrapling_body(page), "html.parser").get_text(" ", strip=True)
-    m = re.search(r"1\s*USD\s*[=:]\s*([\d,.]+)\s*BDT", text, re.I)
+    text = html_to_text(_scrapling_body(page))
+    m = _NSAVE_RE.search(text)
     if m:
         rate = float(m.group(1).replace(",", ""))
         if 50 < rate < 200:
             return rate
-    for x in re.findall(r"(\d{2,4}\.\d{1,6})\s*BDT", text):
+    for x in BDT_NUMBER_RE.findall(text):
         v = float(x)
         if 50 < v < 200:
             return v
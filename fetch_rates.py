@@ -7,24 +7,34 @@ To add a new provider, subclass ``Provider`` and implement ``fetch_rate``:
         name     = "MyProvider"
         url      = "https://example.com/bangladesh"
         delivery = "Bank"
+        returns_fee = True  # fetch_rate returns (rate, fee); omit to return a bare rate
 
         async def fetch_rate(self, session, src):
             async with session.get(f"https://api.example.com/{src}", timeout=TIMEOUT) as r:
                 if r.status != 200:
                     return None
-                data = await r.json(content_type=None)
+                data = orjson.loads(await r.read())
                 rate = data.get("rate")
                 fee = data.get("fee")  # optional
-                return (rate, fee) if fee is not None else rate
+                return rate, fee
 
 That's it — the provider auto-registers and the runner picks it up.
 """
 from __future__ import annotations
 
 import asyncio
-import json
 import logging
+import os
 import time
+from datetime import datetime, timezone
+from pathlib import Path
+
+import orjson
+
+try:
+    import uvloop
+except ImportError:  # optional: not available on Windows; the stdlib loop works everywhere
+    uvloop = None
 
 from currency_rates import (
     ROOT,
@@ -55,20 +65,40 @@ __all__ = [
 logger = logging.getLogger(__name__)
 
 
+def _atomic_write(path: Path, payload: bytes) -> None:
+    """Write *payload* beside *path* and rename it over, so readers never see half a file."""
+    tmp = path.with_name(path.name + ".tmp")
+    tmp.write_bytes(payload)
+    os.replace(tmp, path)
+
+
+async def _update(json_path: Path, readme_path: Path) -> dict:
+    """Fetch all rates, then write rates.json and README.md in parallel."""
+    # One timestamp for both outputs, so the README need not parse it back out of rates.json.
+    now = datetime.now(timezone.utc)
+    data = await fetch_all(now=now)
+    # README rendering runs in a worker thread while the JSON is serialised here.
+    readme_task = asyncio.create_task(asyncio.to_thread(build_readme, data, now))
+    json_bytes = orjson.dumps(data, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE)
+    json_write = asyncio.create_task(asyncio.to_thread(_atomic_write, json_path, json_bytes))
+    readme = await readme_task
+    await asyncio.gather(
+        json_write,
+        asyncio.to_thread(_atomic_write, readme_path, readme.encode("utf-8")),
+    )
+    return data
+
+
 if __name__ == "__main__":
     logging.basicConfig(level=logging.INFO, format="%(message)s")
     json_path = ROOT / "rates.json"
     readme_path = ROOT / "README.md"
 
     start = time.monotonic()
-    data = asyncio.run(fetch_all())
+    loop_factory = uvloop.new_event_loop if uvloop is not None else None
+    with asyncio.Runner(loop_factory=loop_factory) as runner:
+        data = runner.run(_update(json_path, readme_path))
     elapsed = time.monotonic() - start
 
-    json_path.write_text(
-        json.dumps(data, indent=4, ensure_ascii=False), encoding="utf-8"
-    )
-    readme = build_readme(data)
-    readme_path.write_text(readme, encoding="utf-8")
-
     total = sum(len(v) for v in data["rates"].values())
     logger.info("\n✅ %d rates fetched in %.1fs", total, elapsed)
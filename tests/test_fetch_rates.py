@@ -143,6 +143,24 @@ def test_sendwave_entries_have_fee_when_present():
     )
 
 
+def test_readme_matches_rates_json():
+    """README.md is exactly what build_readme renders from the committed rates.json."""
+    from fetch_rates import build_readme
+
+    data = load_rates()
+    assert build_readme(data) == (ROOT / "README.md").read_text(encoding="utf-8")
+
+
+def test_readme_uses_passed_timestamp():
+    """build_readme formats the datetime it is given instead of reparsing updated_at."""
+    from datetime import datetime, timezone
+
+    from fetch_rates import build_readme
+
+    when = datetime(2030, 1, 2, 3, 4, tzinfo=timezone.utc)
+    assert "**Last updated:** `2030-01-02 03:04 UTC`" in build_readme(load_rates(), when)
+
+
 def test_fetch_all_produces_valid_structure():
     """Integration: fetch_all() returns the same structure we expect in rates.json."""
     from fetch_rates import fetch_all, CURRENCIES, TARGET
@@ -0,0 +1,25 @@
+"""Tests for html_to_text: the tag stripper the HTML providers regex against."""
+from __future__ import annotations
+
+from currency_rates.html_text import BDT_NUMBER_RE, html_to_text
+
+
+def test_html_to_text_joins_inline_elements():
+    """Numbers and codes split across tags come out space-separated, entities decoded."""
+    html = "<div><span>1.00</span>&nbsp;<b>USD</b> = <i>122.5</i> BDT</div>"
+    assert html_to_text(html) == "1.00 USD = 122.5 BDT"
+
+
+def test_html_to_text_drops_scripts_styles_and_comments():
+    """Non-visible content must not leak spurious BDT numbers into the text."""
+    html = (
+        "<head><style>p{color:red}</style><SCRIPT>var r = '999.9 BDT';</SCRIPT></head>"
+        "<body><!-- 777.7 BDT --><p>Fee: 1.99 USD</p><template>5.5 BDT</template></body>"
+    )
+    assert html_to_text(html) == "Fee: 1.99 USD"
+
+
+def test_bdt_number_re_matches_ascii_digits_only():
+    """Non-ASCII digits (e.g. Bengali) are not mistaken for rates; NBSP is folded first."""
+    text = html_to_text("<p>১২২.৫০ BDT</p><p>122.50&nbsp;BDT</p>")
+    assert BDT_NUMBER_RE.findall(text) == ["122.50"]
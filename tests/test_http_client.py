@@ -0,0 +1,38 @@
+"""Tests for http_client.cached_json: the on-disk API response cache."""
+from __future__ import annotations
+
+import asyncio
+from contextlib import asynccontextmanager
+
+from currency_rates.http_client import cached_json
+
+
+class _Response:
+    status = 200
+
+    async def read(self) -> bytes:
+        return b'{"rate": 121.5}'
+
+
+class _Session:
+    def __init__(self):
+        self.calls = 0
+
+    @asynccontextmanager
+    async def get(self, url, **kwargs):
+        self.calls += 1
+        yield _Response()
+
+
+def test_cached_json_reuses_body_within_ttl(tmp_path):
+    """A second call inside the TTL is served from disk; ttl=0 always refetches."""
+    session = _Session()
+
+    async def fetch(ttl):
+        return await cached_json(session, "https://example.com/api", ttl, cache_dir=tmp_path)
+
+    assert asyncio.run(fetch(600)) == {"rate": 121.5}
+    assert asyncio.run(fetch(600)) == {"rate": 121.5}
+    assert session.calls == 1
+    asyncio.run(fetch(0))
+    assert session.calls == 2
@@ -0,0 +1,151 @@
+"""Tests for RateCache and the cache-aware, deduplicating Provider.scrape path."""
+from __future__ import annotations
+
+import asyncio
+import time
+
+from currency_rates.providers.base import Provider
+from currency_rates.rate_cache import MAX_STALE_AGE, RateCache
+
+
+class _FlakyProvider(Provider):
+    name = "Flaky"
+    url = "https://example.com"
+    delivery = "Bank"
+    cache_ttl = 60
+
+    def __init__(self, result):
+        super().__init__()
+        self.result = result
+        self.calls = 0
+
+    async def fetch_rate(self, session, src):
+        self.calls += 1
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def test_rate_cache_round_trip(tmp_path):
+    """Saved entries load back and respect max_age."""
+    path = tmp_path / "cache.json"
+    cache = RateCache(path)
+    cache.put("Wise", "USD", 122.2, None)
+    cache.save()
+
+    loaded = RateCache(path)
+    loaded.load()
+    assert loaded.get("Wise", "USD", 60).rate == 122.2
+    assert loaded.get("Wise", "GBP", 60) is None
+    assert loaded.get("Wise", "USD", -1) is None
+
+
+def test_rate_cache_drops_malformed_entries(tmp_path):
+    """Entries with non-numeric fields are skipped on load instead of breaking scrape()."""
+    path = tmp_path / "cache.json"
+    path.write_text(
+        '{"Wise:USD": {"rate": "122.1", "fee": null, "ts": 1.0},'
+        ' "Wise:GBP": {"rate": 155.5, "fee": 2, "ts": 1e12}, "Wise:EUR": []}'
+    )
+    cache = RateCache(path)
+    cache.load()
+    assert list(cache._entries) == ["Wise:GBP"]
+    assert cache.get("Wise", "GBP", float("inf")).fee == 2.0
+
+
+def test_scrape_serves_fresh_cache_without_fetching(tmp_path):
+    """A hit younger than cache_ttl short-circuits fetch_rate."""
+    cache = RateCache(tmp_path / "cache.json")
+    cache.put("Flaky", "USD", 120.0, 1.5)
+    p = _FlakyProvider(130.0)
+    p._rate_cache = cache
+    rate = asyncio.run(p.scrape(None, "USD"))
+    assert (rate.rate, rate.fee, p.calls) == (120.0, 1.5, 0)
+
+
+def test_scrape_falls_back_to_last_good_value(tmp_path):
+    """A failing fetch returns the stale cached rate, but not one past MAX_STALE_AGE."""
+    cache = RateCache(tmp_path / "cache.json")
+    cache.put("Flaky", "USD", 120.0, None)
+    cache._entries["Flaky:USD"].ts = time.time() - 3600
+    p = _FlakyProvider(RuntimeError("boom"))
+    p._rate_cache = cache
+    assert asyncio.run(p.scrape(None, "USD")).rate == 120.0
+    assert p.calls == 1
+
+    cache._entries["Flaky:USD"].ts = time.time() - MAX_STALE_AGE - 1
+    assert asyncio.run(p.scrape(None, "USD")) is None
+
+
+def test_timed_out_fetch_falls_back_to_last_good_value(tmp_path):
+    """A fetch exceeding the provider timeout still serves the stale cached rate."""
+
+    class _HungProvider(_FlakyProvider):
+        timeout = 0.01
+
+        async def fetch_rate(self, session, src):
+            await asyncio.sleep(10)
+
+    cache = RateCache(tmp_path / "cache.json")
+    cache.put("Flaky", "USD", 120.0, None)
+    cache._entries["Flaky:USD"].ts = time.time() - 3600
+    p = _HungProvider(None)
+    p._rate_cache = cache
+    assert asyncio.run(p.scrape(None, "USD")).rate == 120.0
+
+
+def test_concurrent_scrapes_share_one_fetch():
+    """Identical (provider, currency) calls in flight together hit fetch_rate once."""
+    p = _FlakyProvider(125.0)
+
+    async def run():
+        return await asyncio.gather(p.scrape(None, "USD"), p.scrape(None, "USD"))
+
+    a, b = asyncio.run(run())
+    assert a is b and a.rate == 125.0
+    assert p.calls == 1 and not p._inflight
+
+
+def test_cancelled_waiter_does_not_cancel_shared_fetch():
+    """A caller timing out leaves the shared fetch running for the other waiters."""
+
+    class _SlowProvider(_FlakyProvider):
+        async def fetch_rate(self, session, src):
+            await asyncio.sleep(0.01)
+            return await super().fetch_rate(session, src)
+
+    p, other = _SlowProvider(125.0), _SlowProvider(130.0)
+
+    async def run():
+        first = asyncio.create_task(p.scrape(None, "EUR"))
+        second = asyncio.create_task(p.scrape(None, "EUR"))
+        third = asyncio.create_task(other.scrape(None, "EUR"))
+        await asyncio.sleep(0)
+        first.cancel()
+        return await second, await third
+
+    b, c = asyncio.run(run())
+    assert (b.rate, c.rate) == (125.0, 130.0)
+    assert p.calls == other.calls == 1
+
+
+def test_cancel_inflight_stops_shielded_fetch():
+    """cancel_inflight() reaches the shared fetch that cancelling a caller leaves running."""
+
+    class _HungProvider(_FlakyProvider):
+        async def fetch_rate(self, session, src):
+            self.calls += 1
+            await asyncio.sleep(10)
+
+    p = _HungProvider(None)
+
+    async def run():
+        caller = asyncio.create_task(p.scrape(None, "USD"))
+        await asyncio.sleep(0.01)
+        inner = next(iter(p._inflight.values()))
+        caller.cancel()
+        await p.cancel_inflight()
+        return inner
+
+    inner = asyncio.run(run())
+    assert inner.cancelled() and p.calls == 1 and not p._inflight